@@ -1,8 +1,11 @@
 import dash
 from dash import html, dcc
 import plotly.graph_objs as go
+import plotly.io as pio
+from plotly.subplots import make_subplots
 import numpy as np
 import random
+from functools import lru_cache
 
 app = dash.Dash(__name__)
 
@@ -13,58 +16,69 @@ risk_metrics = {
     "Counterparty Exposure": random.randint(0, 100),
 }
 
-def create_gradient_bar(title, value):
-    colors = []
-    for x in range(0, 101, 5):
-        if x < 33:
-            colors.append("green")
-        elif x < 66:
-            colors.append("yellow")
-        else:
-            colors.append("red")
+# Gradient segments: 21 bars of width 5 covering 0-100
+_BASES = np.arange(0, 105, 5)
+_COLORS = tuple(np.where(_BASES < 33, "green", np.where(_BASES < 66, "yellow", "red")).tolist())
 
-    bar_fig = go.Figure()
+# Gradient bar shared by every gauge row
+_GRADIENT_BAR = go.Bar(
+    x=np.full(_BASES.size, 5),
+    y=[""] * _BASES.size,
+    base=_BASES,
+    orientation='h',
+    marker=dict(color=_COLORS),
+    showlegend=False,
+    hoverinfo='skip'
+)
 
-    for i in range(len(colors)):
-        bar_fig.add_trace(go.Bar(
-            x=[5],
-            y=[""],
-            base=i * 5,
-            orientation='h',
-            marker=dict(color=colors[i]),
-            showlegend=False,
-            hoverinfo='skip'
-        ))
+@lru_cache(maxsize=512)
+def _fig_json(metrics):
+    bar_fig = make_subplots(
+        rows=len(metrics), cols=1,
+        subplot_titles=[title for title, _ in metrics],
+        vertical_spacing=0.2
+    )
 
-    bar_fig.add_trace(go.Scatter(
-        x=[value],
-        y=[""],
-        mode="markers+text",
-        marker=dict(color="black", size=12),
-        text=[f"{value}"],
-        textposition="top center",
-        showlegend=False
-    ))
+    for row, (title, value) in enumerate(metrics, start=1):
+        bar_fig.add_trace(_GRADIENT_BAR, row=row, col=1)
+        bar_fig.add_trace(go.Scatter(
+            x=[value],
+            y=[""],
+            mode="markers+text",
+            marker=dict(color="black", size=12),
+            text=[f"{value}"],
+            textposition="top center",
+            showlegend=False
+        ), row=row, col=1)
 
+    bar_fig.update_xaxes(range=[0, 100], visible=False)
+    bar_fig.update_yaxes(visible=False)
     bar_fig.update_layout(
-        height=60,
-        margin=dict(t=10, b=10, l=10, r=10),
-        xaxis=dict(range=[0, 100], visible=False),
-        yaxis=dict(visible=False),
-        title=dict(text=title, x=0.5)
+        height=90 * len(metrics),
+        margin=dict(t=30, b=10, l=10, r=10)
     )
 
-    return dcc.Graph(figure=bar_fig, config={"displayModeBar": False})
+    return pio.to_json(bar_fig)
 
-app.layout = html.Div(
-    style={"padding": "40px", "font-family": "Arial"},
-    children=[
-        html.H1("🎯 Risk Appetite", style={"text-align": "center", "margin-bottom": "40px"}),
-        html.Div([
-            create_gradient_bar(metric, val) for metric, val in risk_metrics.items()
-        ])
-    ]
-)
+def create_gradient_bars(metrics):
+    # One figure for all gauges; values are bucketed to ints so identical sets share a cache entry
+    key = tuple((title, int(round(value))) for title, value in metrics.items())
+    figure = pio.from_json(_fig_json(key))
+    return dcc.Graph(figure=figure, config={"displayModeBar": False})
+
+# Dash calls a function layout on every page load, so reloads hit the figure cache
+def serve_layout():
+    return html.Div(
+        style={"padding": "40px", "font-family": "Arial"},
+        children=[
+            html.H1("🎯 Risk Appetite", style={"text-align": "center", "margin-bottom": "40px"}),
+            html.Div([
+                create_gradient_bars(risk_metrics)
+            ])
+        ]
+    )
+
+app.layout = serve_layout
 
 if __name__ == '__main__':
     app.run_server(debug=True)
@@ -3,9 +3,11 @@ import pandas as pd
 import numpy as np
 import yfinance as yf
 import plotly.graph_objects as go
-import random
-import plotly.express as px
+import plotly.io as pio
+from kernels import rolling_std, drawdowns_kernel, quantile_fast
 
+# Serialize figures with orjson, which encodes numpy arrays natively
+pio.json.config.default_engine = "orjson"
 
 st.set_page_config(page_title="Bank Risk Dashboard", layout="wide")
 
@@ -34,50 +36,119 @@ with st.sidebar:
 
 
 # === Load Data ===
-@st.cache_data
-def load_data():
+class SpyUnavailable(Exception):
+    pass
+
+# In-memory cache of the raw download; expires so a failed ticker is retried later
+@st.cache_data(ttl=3600)
+def download_prices():
     tickers = [
         'AAPL', 'MSFT', 'JPM', 'BA', 'V', 'KO', 'MCD', 'IBM', 'HD', 'DIS',
         'GS', 'UNH', 'CAT', 'NKE', 'PG', 'CRM', 'MRK', 'WMT', 'AMGN', 'CSCO'
     ]
-    data = yf.download(tickers, start="2023-01-01", end="2024-12-31", auto_adjust=True, group_by="ticker")
-    return data
-
-data = load_data()
+    # SPY rides along in the same request so beta needs no second round-trip
+    data = yf.download(tickers + ['SPY'], start="2023-01-01", end="2024-12-31",
+                       auto_adjust=True, group_by="ticker", threads=True)
+
+    # float32 is ample precision for daily prices and halves the bytes every pass moves
+    closes = data.xs('Close', axis=1, level=1).astype(np.float32)
+    # yfinance returns all-NaN columns for tickers that failed instead of raising
+    if closes.empty or closes[tickers].isna().all().any():
+        raise ValueError("incomplete price download")
+    close_prices = closes[tickers]
+    spy_close = closes['SPY']
+    return close_prices, spy_close
+
+# The date range is fixed, so persist the download to disk and reuse it across restarts.
+# Disk-persisted entries never expire, so only a complete download (SPY included) is
+# persisted; anything else raises, and Streamlit does not cache exceptions.
+@st.cache_data(persist="disk")
+def load_data():
+    close_prices, spy_close = download_prices()
+    if spy_close.isna().all():
+        raise SpyUnavailable()
+    return close_prices, spy_close
 
-# === Extract Close Prices ===
 try:
-    close_prices = pd.DataFrame({ticker: data[ticker]['Close'] for ticker in data.columns.levels[0]})
+    close_prices, spy = load_data()
+except SpyUnavailable:
+    # Dow prices are fine, so serve them from the in-memory cache; beta reports itself unavailable
+    close_prices, spy = download_prices()
 except Exception:
-    st.error("❌ Failed to extract 'Close' prices from the data.")
+    st.error("❌ Data failed to load. Try refreshing or check internet connection.")
     st.stop()
 
-returns = close_prices.pct_change().dropna()
-weights = np.array([1/20] * 20)  # Equal weights
-portfolio_returns = returns.dot(weights)
+# Shared views for the ticker drilldown, so a selection doesn't copy a column
+tickers_list = list(close_prices.columns)
+close_np = close_prices.to_numpy()
+dates = close_prices.index
+
+# === Risk Metrics ===
+# Everything derived from prices is pure, so cache it and skip the work on widget reruns
+@st.cache_data
+def compute_risk(close_prices, spy_close):
+    # Simple returns on the raw price matrix; rows with any missing price are dropped
+    prices = np.ascontiguousarray(close_prices.to_numpy(dtype=np.float32))
+    returns = prices[1:] / prices[:-1] - 1.0
+    valid = ~np.isnan(returns).any(axis=1)
+    returns = returns[valid]
+    weights = np.full(prices.shape[1], 1.0 / prices.shape[1], dtype=np.float32)  # Equal weights
+    portfolio_returns = pd.Series(returns @ weights, index=close_prices.index[1:][valid])
+    port_np = np.ascontiguousarray(portfolio_returns.to_numpy())
+
+    volatility = portfolio_returns.std() * np.sqrt(252)
+
+    # VaR and beta are reported as None when they cannot be computed
+    try:
+        VaR_95 = quantile_fast(port_np, 0.05) * np.sqrt(252)
+        VaR_99 = quantile_fast(port_np, 0.01) * np.sqrt(252)
+    except Exception:
+        VaR_95 = VaR_99 = None
+
+    try:
+        spy_returns = spy_close.pct_change().dropna()
+        idx = portfolio_returns.index.intersection(spy_returns.index)
+        if len(idx) < 2:
+            beta = None
+        else:
+            p = portfolio_returns.loc[idx].to_numpy()
+            s = spy_returns.loc[idx].to_numpy()
+            beta = np.cov(p, s)[0, 1] / s.var(ddof=1)
+    except Exception:
+        beta = None
+
+    rolling_vol = pd.Series(rolling_std(port_np, 30) * np.sqrt(252), index=portfolio_returns.index)
+    # Single fused pass shared by every drawdown view
+    drawdowns = pd.Series(drawdowns_kernel(port_np), index=portfolio_returns.index)
+
+    return dict(
+        portfolio_returns=portfolio_returns,
+        volatility=volatility,
+        VaR_95=VaR_95,
+        VaR_99=VaR_99,
+        beta=beta,
+        rolling_vol=rolling_vol,
+        drawdowns=drawdowns,
+    )
+
+risk = compute_risk(close_prices, spy)
+portfolio_returns = risk["portfolio_returns"]
+volatility = risk["volatility"]
+VaR_95, VaR_99 = risk["VaR_95"], risk["VaR_99"]
+beta = risk["beta"]
+rolling_vol = risk["rolling_vol"]
+drawdowns = risk["drawdowns"]
 
 # === Safety Checks ===
-if close_prices.empty or returns.empty or portfolio_returns.empty:
+if portfolio_returns.empty:
     st.error("❌ Data failed to load. Try refreshing or check internet connection.")
     st.stop()
 
-# === Risk Metrics ===
-volatility = portfolio_returns.std() * np.sqrt(252)
-
-try:
-    VaR_95 = np.percentile(portfolio_returns, 5) * np.sqrt(252)
-    VaR_99 = np.percentile(portfolio_returns, 1) * np.sqrt(252)
-except:
+if VaR_95 is None or VaR_99 is None:
     VaR_95 = VaR_99 = 0
     st.warning("⚠️ VaR unavailable due to insufficient data.")
 
-try:
-    spy = yf.download('SPY', start="2023-01-01", end="2024-12-31", auto_adjust=True)['Close']
-    spy_returns = spy.pct_change().dropna()
-    aligned = pd.concat([portfolio_returns, spy_returns], axis=1).dropna()
-    aligned.columns = ['Portfolio', 'SPY']
-    beta = np.cov(aligned['Portfolio'], aligned['SPY'])[0, 1] / np.var(aligned['SPY'])
-except:
+if beta is None:
     beta = 0
     st.warning("⚠️ Beta unavailable due to SPY data issue.")
 
@@ -108,6 +179,35 @@ st.markdown("<h1 style='text-align: center;'>Risk Dashboard</h1>", unsafe_allow_
 
 
 
+# === Simulated Data ===
+# All simulated values derive from one date seed, drawn in a single cached batch so
+# they are stable within a day and not redrawn on every rerun. Each drilldown gets
+# its own child stream of that seed so no two tabs replay the same random numbers.
+mock_seed = int(pd.Timestamp.today().strftime("%Y%m%d"))
+
+@st.cache_data(ttl=3600)
+def mock_draws(seed):
+    (overview, credit, cyber, operational,
+     compliance, liquidity, tech, emerging) = [
+        np.random.default_rng(s) for s in np.random.SeedSequence(seed).spawn(8)
+    ]
+    return dict(
+        risk_levels=overview.choice(["Low", "Medium", "High"], size=9).tolist(),
+        health_score=int(overview.integers(0, 101)),
+        limit_statuses=overview.choice(["Green", "Yellow", "Red"], size=3).tolist(),
+        threat_score=int(cyber.integers(20, 96)),
+        cds_spread=credit.normal(loc=80, scale=10, size=30).clip(50, 150),
+        risk_score=credit.normal(6, 1, size=30).clip(1, 10),
+        alerts=cyber.poisson(5, 30),
+        op_incidents=operational.integers(1, 15, size=5),
+        issue_counts=compliance.integers(1, 15, size=5),
+        lcr=liquidity.normal(115, 10, size=30).clip(70, 140),
+        uptime=tech.normal(99.7, 0.2, size=30).clip(98.5, 100),
+        radar_scores=emerging.integers(3, 10, size=5),
+    )
+
+draws = mock_draws(mock_seed)
+
 # === Executive Overview ===
 st.markdown("## Executive Overview")
 
@@ -117,17 +217,11 @@ col1, col2, col3 = st.columns([1.2, 1, 1])
 with col1:
     st.markdown("### 🔥 Risk Category Heatmap")
 
-    risk_categories = {
-        "Credit Risk": random.choice(["Low", "Medium", "High"]),
-        "Liquidity Risk": random.choice(["Low", "Medium", "High"]),
-        "Operational Risk": random.choice(["Low", "Medium", "High"]),
-        "Cybersecurity Risk": random.choice(["Low", "Medium", "High"]),
-        "Compliance Risk": random.choice(["Low", "Medium", "High"]),
-        "Legal Risk": random.choice(["Low", "Medium", "High"]),
-        "Tech Risk": random.choice(["Low", "Medium", "High"]),
-        "Geopolitical Risk": random.choice(["Low", "Medium", "High"]),
-        "Emerging Risk": random.choice(["Low", "Medium", "High"]),
-    }
+    risk_categories = dict(zip([
+        "Credit Risk", "Liquidity Risk", "Operational Risk",
+        "Cybersecurity Risk", "Compliance Risk", "Legal Risk",
+        "Tech Risk", "Geopolitical Risk", "Emerging Risk",
+    ], draws["risk_levels"]))
 
     def risk_color(level):
         return {
@@ -145,31 +239,26 @@ with col1:
 with col2:
     st.markdown("### 🧪 Risk Health Score")
 
-    health_score = random.randint(0, 100)  # Simulated score
-
-    fig = go.Figure(go.Indicator(
-        mode="gauge+number",
-        value=health_score,
-        number={'suffix': " / 100"},
-        title={'text': "Overall Health"},
-        gauge={
-            'axis': {'range': [0, 100]},
-            'bar': {'color': "black"},
-            'steps': [
-                {'range': [0, 33], 'color': "green"},
-                {'range': [33, 66], 'color': "yellow"},
-                {'range': [66, 100], 'color': "red"},
-            ],
-            'threshold': {
-                'line': {'color': "black", 'width': 4},
-                'thickness': 0.75,
-                'value': health_score
-            }
-        }
-    ))
-
-    fig.update_layout(height=270, margin=dict(t=10, b=0))
-    st.plotly_chart(fig, use_container_width=True)
+    health_score = draws["health_score"]  # Simulated score
+
+    # Plain HTML ring instead of a Plotly Indicator: same green/yellow/red bands,
+    # no figure to build or lay out on every rerun
+    health_color = "green" if health_score < 33 else "yellow" if health_score < 66 else "red"
+
+    # Built without leading indentation so Markdown doesn't render it as a code block
+    health_html = (
+        '<div style="display: flex; flex-direction: column; align-items: center; padding: 20px 0;">'
+        '<div style="font-size: 17px; margin-bottom: 12px;">Overall Health</div>'
+        '<div style="width: 180px; height: 180px; border-radius: 50%; '
+        f'background: conic-gradient({health_color} {health_score}%, #eee 0); '
+        'display: flex; align-items: center; justify-content: center;">'
+        '<div style="width: 130px; height: 130px; border-radius: 50%; background: white; '
+        'display: flex; align-items: center; justify-content: center; '
+        f'font-size: 28px; font-weight: bold;">{health_score} / 100</div>'
+        '</div>'
+        '</div>'
+    )
+    st.markdown(health_html, unsafe_allow_html=True)
 
 
 
@@ -177,11 +266,10 @@ with col2:
 with col3:
     st.markdown("### 🚦 Risk Appetite")
 
-    limits = {
-        "VaR Limit": random.choice(["Green", "Yellow", "Red"]),
-        "Liquidity Ratio": random.choice(["Green", "Yellow", "Red"]),
-        "Counterparty Exposure": random.choice(["Green", "Yellow", "Red"]),
-    }
+    limits = dict(zip(
+        ["VaR Limit", "Liquidity Ratio", "Counterparty Exposure"],
+        draws["limit_statuses"]
+    ))
 
     def color_square(status):
         return {
@@ -217,6 +305,180 @@ risk_descriptions = {
     "Emerging Risk": "New or evolving risks (e.g., AI misuse, climate transition)."
 }
 
+# === Mock Drilldown Data ===
+# The drilldown frames are built from the shared draws above and cached the same way.
+
+@st.cache_data(ttl=3600)
+def mock_credit_risk(seed):
+    draws = mock_draws(seed)
+
+    cds_df = pd.DataFrame({
+        "Date": pd.date_range(end=pd.Timestamp.today(), periods=30),
+        "CDS Spread (bps)": draws["cds_spread"]
+    })
+
+    counterparty_df = pd.DataFrame({
+        "Counterparty": ["JPM", "GS", "P72", "Citi", "Softbank"],
+        "Exposure ($M)": [120, 95, 88, 73, 60],
+        "Rating": ["A-", "BBB+", "BB", "A", "BBB"]
+    })
+
+    score_data = pd.DataFrame({
+        "Date": pd.date_range(end=pd.Timestamp.today(), periods=30),
+        "Risk Score": draws["risk_score"]
+    })
+    # Format dates to dd/mm
+    score_data["Date"] = score_data["Date"].dt.strftime("%d/%m")
+
+    return cds_df, counterparty_df, score_data
+
+@st.cache_data(ttl=3600)
+def mock_cyber_risk(seed):
+    draws = mock_draws(seed)
+
+    incidents = pd.DataFrame({
+        "Date": pd.date_range(end=pd.Timestamp.today(), periods=5),
+        "Event": [
+            "Phishing attempt flagged",
+            "Malware blocked by endpoint",
+            "Suspicious login from unknown device",
+            "Firewall rule triggered",
+            "Unauthorized access to shared drive"
+        ],
+        "Status": ["Investigating", "Resolved", "Investigating", "Resolved", "Escalated"]
+    })
+
+    attack_volume = pd.DataFrame({
+        "Date": pd.date_range(end=pd.Timestamp.today(), periods=30),
+        "Alerts": draws["alerts"]
+    })
+
+    return incidents, attack_volume
+
+@st.cache_data(ttl=3600)
+def mock_operational_risk(seed):
+    draws = mock_draws(seed)
+
+    categories = ["Process Failure", "System Outage", "Human Error", "Third-Party", "Fraud"]
+    category_df = pd.DataFrame({
+        "Category": categories,
+        "Incidents": draws["op_incidents"]
+    })
+
+    op_events = pd.DataFrame({
+        "Date": pd.date_range(end=pd.Timestamp.today(), periods=5),
+        "Event": [
+            "Payment system outage (2h)",
+            "Incorrect NAV calculation",
+            "Trade reconciliation error",
+            "Cloud sync failure",
+            "Vendor SLA breach"
+        ],
+        "Status": ["Resolved", "Investigating", "Resolved", "Monitoring", "Escalated"]
+    })
+
+    controls_df = pd.DataFrame({
+        "Control": ["Access Management", "Data Reconciliation", "Backup Procedures", "Incident Response"],
+        "Status": ["Good", "Needs Review", "Good", "At Risk"]
+    })
+
+    return category_df, op_events, controls_df
+
+@st.cache_data(ttl=3600)
+def mock_compliance_risk(seed):
+    draws = mock_draws(seed)
+
+    issue_types = ["KYC/AML", "Trade Reporting", "Insider Trading", "Disclosure", "Privacy"]
+    issue_df = pd.DataFrame({
+        "Type": issue_types,
+        "Count": draws["issue_counts"]
+    })
+
+    training_df = pd.DataFrame({
+        "Employee": ["Alice Smith", "John Doe", "Eva Zhang", "Carlos Reyes", "Sarah Patel"],
+        "Training": ["AML Refresher", "Market Conduct", "Data Privacy", "Code of Ethics", "KYC Basics"],
+        "Due Date": pd.date_range(end=pd.Timestamp.today(), periods=5).strftime("%d/%m/%Y"),
+        "Status": ["Overdue", "Overdue", "Completed", "Overdue", "Completed"]
+    })
+
+    exceptions_df = pd.DataFrame({
+        "Policy": ["Expense Reporting", "Trade Pre-Clearance", "Gift Limits"],
+        "# of Exceptions": [3, 5, 2],
+        "Review Status": ["Pending", "Under Review", "Closed"]
+    })
+
+    return issue_df, training_df, exceptions_df
+
+@st.cache_data(ttl=3600)
+def mock_liquidity_risk(seed):
+    draws = mock_draws(seed)
+
+    lcr_data = pd.DataFrame({
+        "Date": pd.date_range(end=pd.Timestamp.today(), periods=30),
+        "LCR (%)": draws["lcr"]
+    })
+
+    cash_df = pd.DataFrame({
+        "Currency": ["USD", "EUR", "GBP", "JPY", "CHF"],
+        "Cash Available ($M)": [850, 430, 220, 310, 140]
+    })
+
+    stress_df = pd.DataFrame({
+        "Scenario": ["Base Case", "Mild Outflow", "Severe Outflow", "Extreme Stress"],
+        "Liquidity Gap ($M)": [0, -120, -300, -580]
+    })
+
+    return lcr_data, cash_df, stress_df
+
+@st.cache_data(ttl=3600)
+def mock_tech_risk(seed):
+    draws = mock_draws(seed)
+
+    uptime_data = pd.DataFrame({
+        "Date": pd.date_range(end=pd.Timestamp.today(), periods=30),
+        "Uptime %": draws["uptime"]
+    })
+
+    incidents_df = pd.DataFrame({
+        "Date": pd.date_range(end=pd.Timestamp.today(), periods=5),
+        "System": ["Order Mgmt", "Risk Engine", "Trading API", "CRM", "Data Warehouse"],
+        "Impact": ["High", "Medium", "High", "Low", "Medium"],
+        "Status": ["Resolved", "Monitoring", "Escalated", "Resolved", "Resolved"]
+    })
+
+    devops_df = pd.DataFrame({
+        "Metric": ["Deploys", "Rollback %", "Hotfixes", "Failed Jobs"],
+        "Value": [42, "2%", 5, 3]
+    })
+
+    return uptime_data, incidents_df, devops_df
+
+@st.cache_data
+def mock_geopolitical_risk():
+    country_df = pd.DataFrame({
+        "Country": ["Ukraine", "China", "Iran", "Venezuela", "South Sudan"],
+        "Risk Score": [9.5, 8.2, 7.8, 6.9, 6.5],
+        "Event": ["War", "Tarriffs", "Sanctions", "Political Unrest", "Oil Conflict"]
+    })
+
+    exposure_df = pd.DataFrame({
+        "Region": ["North America", "Europe", "Asia", "Middle East", "South America"],
+        "Exposure (%)": [40, 25, 15, 10, 10]
+    })
+
+    return country_df, exposure_df
+
+@st.cache_data(ttl=3600)
+def mock_emerging_risk(seed):
+    draws = mock_draws(seed)
+
+    radar_df = pd.DataFrame({
+        "Risk": ["AI Ethics", "Quantum Risk", "Climate Litigation", "ESG Data Gaps", "Decentralized Finance"],
+        "Score (1–10)": draws["radar_scores"]
+    })
+
+    return radar_df
+
 for tab, label in zip(tabs, risk_descriptions.keys()):
     with tab:
     
@@ -224,39 +486,17 @@ for tab, label in zip(tabs, risk_descriptions.keys()):
             with st.expander("📉 Credit Risk – Click to expand / collapse", expanded=False):
                 st.subheader("📈 Corporate CDS Spread (bps)")
 
-                cds_dates = pd.date_range(end=pd.Timestamp.today(), periods=30)
-                cds_spread = np.random.normal(loc=80, scale=10, size=30).clip(50, 150)
-
-                cds_df = pd.DataFrame({
-                     "Date": cds_dates,
-                     "CDS Spread (bps)": cds_spread
-        })
+                cds_df, counterparty_df, score_data = mock_credit_risk(mock_seed)
 
                 st.line_chart(cds_df.set_index("Date"))
 
                 st.markdown("---")
                 st.subheader("🏦 Top 5 Counterparties by Exposure")
-
-                counterparty_data = {
-                    "Counterparty": ["JPM", "GS", "P72", "Citi", "Softbank"],
-                    "Exposure ($M)": [120, 95, 88, 73, 60],
-                    "Rating": ["A-", "BBB+", "BB", "A", "BBB"]
-                }
-
-                counterparty_df = pd.DataFrame(counterparty_data)
                 st.dataframe(counterparty_df)
 
                 st.markdown("---")
                 st.subheader("📈 Risk Score Over Time")
 
-                score_data = pd.DataFrame({
-                    "Date": pd.date_range(end=pd.Timestamp.today(), periods=30),
-                    "Risk Score": np.random.normal(6, 1, size=30).clip(1, 10)
-                })
-
-                # Format dates to dd/mm
-                score_data["Date"] = score_data["Date"].dt.strftime("%d/%m")
-
                 fig = go.Figure()
                 fig.add_trace(go.Scatter(x=score_data["Date"], y=score_data["Risk Score"], mode="lines+markers"))
                 fig.update_layout(
@@ -276,7 +516,7 @@ for tab, label in zip(tabs, risk_descriptions.keys()):
             with st.expander("🛡️ Cybersecurity Risk – Click to expand / collapse", expanded=False):
                 st.subheader("🛡️ Threat Level (0–100)")
 
-                threat_score = random.randint(20, 95)
+                threat_score = draws["threat_score"]
 
                 fig = go.Figure(go.Indicator(
                     mode="gauge+number",
@@ -306,28 +546,11 @@ for tab, label in zip(tabs, risk_descriptions.keys()):
                 st.markdown("---")
                 st.subheader("📅 Recent Incidents (Last 30 Days)")
 
-                incidents = pd.DataFrame({
-                    "Date": pd.date_range(end=pd.Timestamp.today(), periods=5),
-                    "Event": [
-                        "Phishing attempt flagged",
-                        "Malware blocked by endpoint",
-                        "Suspicious login from unknown device",
-                        "Firewall rule triggered",
-                        "Unauthorized access to shared drive"
-                    ],
-                    "Status": ["Investigating", "Resolved", "Investigating", "Resolved", "Escalated"]
-                })
-
+                incidents, attack_volume = mock_cyber_risk(mock_seed)
                 st.dataframe(incidents)
 
                 st.markdown("---")
                 st.subheader("📊 Attack Volume (Simulated)")
-
-                attack_volume = pd.DataFrame({
-                    "Date": pd.date_range(end=pd.Timestamp.today(), periods=30),
-                    "Alerts": np.random.poisson(5, 30)
-                })
-
                 st.bar_chart(attack_volume.set_index("Date"))
 
 
@@ -335,44 +558,19 @@ for tab, label in zip(tabs, risk_descriptions.keys()):
             with st.expander("⚙️ Operational Risk – Click to expand / collapse", expanded=False):
                 st.subheader("⚙️ Incident Count by Category")
 
-                categories = ["Process Failure", "System Outage", "Human Error", "Third-Party", "Fraud"]
-                incidents = np.random.randint(1, 15, size=len(categories))
-
-                category_df = pd.DataFrame({
-                    "Category": categories,
-                    "Incidents": incidents
-                })
+                category_df, op_events, controls_df = mock_operational_risk(mock_seed)
 
                 st.bar_chart(category_df.set_index("Category"))
 
                 st.markdown("---")
                 st.subheader("📅 Recent Operational Events")
-
-                op_events = pd.DataFrame({
-                    "Date": pd.date_range(end=pd.Timestamp.today(), periods=5),
-                    "Event": [
-                        "Payment system outage (2h)",
-                        "Incorrect NAV calculation",
-                        "Trade reconciliation error",
-                        "Cloud sync failure",
-                        "Vendor SLA breach"
-                    ],
-                    "Status": ["Resolved", "Investigating", "Resolved", "Monitoring", "Escalated"]
-                })
-
                 st.dataframe(op_events)
 
                 st.markdown("---")
                 st.subheader("🔒 Control Effectiveness Matrix")
-
-                controls_df = pd.DataFrame({
-                    "Control": ["Access Management", "Data Reconciliation", "Backup Procedures", "Incident Response"],
-                    "Status": ["Good", "Needs Review", "Good", "At Risk"]
-                })
-
                 st.dataframe(controls_df)
 
-                if sum(incidents) > 40:
+                if category_df["Incidents"].sum() > 40:
                     st.warning("⚠️ Spike in operational incidents. Immediate review recommended.")
 
 
@@ -380,38 +578,19 @@ for tab, label in zip(tabs, risk_descriptions.keys()):
             with st.expander("⚖️ Compliance Risk – Click to expand / collapse", expanded=False):
                 st.subheader("⚠️ Compliance Violations Breakdown")
 
-                issue_types = ["KYC/AML", "Trade Reporting", "Insider Trading", "Disclosure", "Privacy"]
-                issue_counts = np.random.randint(1, 15, size=len(issue_types))
-
-                issue_df = pd.DataFrame({
-                    "Type": issue_types,
-                    "Count": issue_counts
-                })
+                issue_df, training_df, exceptions_df = mock_compliance_risk(mock_seed)
 
-                fig = px.pie(issue_df, names="Type", values="Count", title="Violations by Type")
+                fig = go.Figure(go.Pie(labels=issue_df["Type"], values=issue_df["Count"]))
+                fig.update_layout(title="Violations by Type")
                 st.plotly_chart(fig, use_container_width=True)
 
                 st.markdown("---")
                 st.subheader("📋 Overdue Training (Sample)")
-
-                training_df = pd.DataFrame({
-                    "Employee": ["Alice Smith", "John Doe", "Eva Zhang", "Carlos Reyes", "Sarah Patel"],
-                    "Training": ["AML Refresher", "Market Conduct", "Data Privacy", "Code of Ethics", "KYC Basics"],
-                    "Due Date": pd.date_range(end=pd.Timestamp.today(), periods=5).strftime("%d/%m/%Y"),
-                    "Status": ["Overdue", "Overdue", "Completed", "Overdue", "Completed"]
-                })
-
                 st.dataframe(training_df)
 
                 st.markdown("---")
                 st.subheader("📑 Policy Exceptions")
 
-                exceptions_df = pd.DataFrame({
-                    "Policy": ["Expense Reporting", "Trade Pre-Clearance", "Gift Limits"],
-                    "# of Exceptions": [3, 5, 2],
-                    "Review Status": ["Pending", "Under Review", "Closed"]
-                })
-
                 # Convert to HTML with style
                 html_table = exceptions_df.to_html(index=False, classes='styled-table')
 
@@ -445,7 +624,7 @@ for tab, label in zip(tabs, risk_descriptions.keys()):
 
 
 
-                if sum(issue_counts) > 30:
+                if issue_df["Count"].sum() > 30:
                     st.warning("⚠️ High volume of compliance issues. Regulatory risk elevated.")
 
         
@@ -453,10 +632,7 @@ for tab, label in zip(tabs, risk_descriptions.keys()):
             with st.expander("💧 Liquidity Risk – Click to expand / collapse", expanded=False):
                 st.subheader("💧 Liquidity Coverage Ratio (LCR) – Last 30 Days")
 
-                lcr_data = pd.DataFrame({
-                    "Date": pd.date_range(end=pd.Timestamp.today(), periods=30),
-                    "LCR (%)": np.random.normal(115, 10, size=30).clip(70, 140)
-                })
+                lcr_data, cash_df, stress_df = mock_liquidity_risk(mock_seed)
 
                 st.line_chart(lcr_data.set_index("Date"))
 
@@ -466,32 +642,17 @@ for tab, label in zip(tabs, risk_descriptions.keys()):
 
                 st.markdown("---")
                 st.subheader("🏦 Cash Buffer by Currency (Mock)")
-
-                cash_df = pd.DataFrame({
-                    "Currency": ["USD", "EUR", "GBP", "JPY", "CHF"],
-                    "Cash Available ($M)": [850, 430, 220, 310, 140]
-                })
-
                 st.bar_chart(cash_df.set_index("Currency"))
 
                 st.markdown("---")
                 st.subheader("📊 Liquidity Stress Test (Simulated)")
-
-                stress_df = pd.DataFrame({
-                    "Scenario": ["Base Case", "Mild Outflow", "Severe Outflow", "Extreme Stress"],
-                    "Liquidity Gap ($M)": [0, -120, -300, -580]
-                })
-
                 st.dataframe(stress_df)
 
         elif label == "Tech Risk":
             with st.expander("💻 Tech Risk – Click to expand / collapse", expanded=False):
                 st.subheader("💻 System Uptime (Rolling 30 Days)")
 
-                uptime_data = pd.DataFrame({
-                    "Date": pd.date_range(end=pd.Timestamp.today(), periods=30),
-                    "Uptime %": np.random.normal(99.7, 0.2, size=30).clip(98.5, 100)
-                })
+                uptime_data, incidents_df, devops_df = mock_tech_risk(mock_seed)
 
                 st.line_chart(uptime_data.set_index("Date"))
 
@@ -500,24 +661,10 @@ for tab, label in zip(tabs, risk_descriptions.keys()):
 
                 st.markdown("---")
                 st.subheader("🔧 Critical System Incidents (Past Month)")
-
-                incidents_df = pd.DataFrame({
-                    "Date": pd.date_range(end=pd.Timestamp.today(), periods=5),
-                    "System": ["Order Mgmt", "Risk Engine", "Trading API", "CRM", "Data Warehouse"],
-                    "Impact": ["High", "Medium", "High", "Low", "Medium"],
-                    "Status": ["Resolved", "Monitoring", "Escalated", "Resolved", "Resolved"]
-                })
-
                 st.dataframe(incidents_df)
 
                 st.markdown("---")
                 st.subheader("🛠️ DevOps Deployment Stats")
-
-                devops_df = pd.DataFrame({
-                    "Metric": ["Deploys", "Rollback %", "Hotfixes", "Failed Jobs"],
-                    "Value": [42, "2%", 5, 3]
-                })
-
                 st.dataframe(devops_df)
 
 
@@ -525,23 +672,15 @@ for tab, label in zip(tabs, risk_descriptions.keys()):
             with st.expander("🌍 Geopolitical Risk – Click to expand / collapse", expanded=False):
                 st.subheader("🌍 Global Hotspots – Country Watchlist")
 
-                country_df = pd.DataFrame({
-                    "Country": ["Ukraine", "China", "Iran", "Venezuela", "South Sudan"],
-                    "Risk Score": [9.5, 8.2, 7.8, 6.9, 6.5],
-                    "Event": ["War", "Tarriffs", "Sanctions", "Political Unrest", "Oil Conflict"]
-                })
+                country_df, exposure_df = mock_geopolitical_risk()
 
                 st.dataframe(country_df)
 
                 st.markdown("---")
                 st.subheader("🧭 Regional Exposure (Mock %)")
 
-                exposure_df = pd.DataFrame({
-                    "Region": ["North America", "Europe", "Asia", "Middle East", "South America"],
-                    "Exposure (%)": [40, 25, 15, 10, 10]
-                })
-
-                fig = px.pie(exposure_df, names="Region", values="Exposure (%)", title="Portfolio Regional Exposure")
+                fig = go.Figure(go.Pie(labels=exposure_df["Region"], values=exposure_df["Exposure (%)"]))
+                fig.update_layout(title="Portfolio Regional Exposure")
                 st.plotly_chart(fig, use_container_width=True)
 
                 st.markdown("---")
@@ -561,12 +700,19 @@ for tab, label in zip(tabs, risk_descriptions.keys()):
             with st.expander("🚀 Emerging Risk – Click to expand / collapse", expanded=False):
                 st.subheader("🚀 Risk Radar – Emerging Themes")
 
-                radar_df = pd.DataFrame({
-                    "Risk": ["AI Ethics", "Quantum Risk", "Climate Litigation", "ESG Data Gaps", "Decentralized Finance"],
-                    "Score (1–10)": np.random.randint(3, 10, size=5)
-                })
+                radar_df = mock_emerging_risk(mock_seed)
 
-                fig = px.bar(radar_df, x="Risk", y="Score (1–10)", color="Score (1–10)", title="Emerging Risk Ratings")
+                fig = go.Figure(go.Bar(
+                    x=radar_df["Risk"],
+                    y=radar_df["Score (1–10)"],
+                    marker=dict(color=radar_df["Score (1–10)"], coloraxis="coloraxis")
+                ))
+                fig.update_layout(
+                    title="Emerging Risk Ratings",
+                    xaxis_title="Risk",
+                    yaxis_title="Score (1–10)",
+                    coloraxis=dict(colorbar=dict(title="Score (1–10)"))
+                )
                 st.plotly_chart(fig, use_container_width=True)
 
                 st.markdown("---")
@@ -590,13 +736,9 @@ with st.expander("📊 Risk Analytics - Click to expand / collapse", expanded=Fa
     # 1. 📉 Max Drawdown Chart
     st.subheader("📉 Portfolio Max Drawdown (Rolling 30 Days)")
 
-    cumulative_returns = (1 + portfolio_returns).cumprod()
-    rolling_max = cumulative_returns.cummax()
-    drawdown = cumulative_returns / rolling_max - 1
-
     drawdown_df = pd.DataFrame({
         "Date": portfolio_returns.index,
-        "Drawdown": drawdown
+        "Drawdown": drawdowns
     }).set_index("Date")
 
     st.line_chart(drawdown_df)
@@ -610,13 +752,16 @@ with st.expander("📊 Risk Analytics - Click to expand / collapse", expanded=Fa
         "Portfolio Impact (%)": [-15.2, -8.5, -6.1, -11.3]
     })
 
-    fig_stress = px.bar(
-        stress_df, 
-        x="Scenario", 
-        y="Portfolio Impact (%)", 
-        color="Portfolio Impact (%)",
-        color_continuous_scale="RdBu",
-        title="Portfolio Loss Under Stress Scenarios"
+    fig_stress = go.Figure(go.Bar(
+        x=stress_df["Scenario"],
+        y=stress_df["Portfolio Impact (%)"],
+        marker=dict(color=stress_df["Portfolio Impact (%)"], coloraxis="coloraxis")
+    ))
+    fig_stress.update_layout(
+        title="Portfolio Loss Under Stress Scenarios",
+        xaxis_title="Scenario",
+        yaxis_title="Portfolio Impact (%)",
+        coloraxis=dict(colorscale="RdBu", colorbar=dict(title="Portfolio Impact (%)"))
     )
     st.plotly_chart(fig_stress, use_container_width=True)
 
@@ -629,12 +774,11 @@ with st.expander("📊 Risk Analytics - Click to expand / collapse", expanded=Fa
         "Exposure (%)": [35, 30, 20, 10, 5]
     })
 
-    fig_factors = px.pie(
-        risk_factors_df, 
-        names="Factor", 
-        values="Exposure (%)", 
-        title="Risk Factor Attribution"
-    )
+    fig_factors = go.Figure(go.Pie(
+        labels=risk_factors_df["Factor"],
+        values=risk_factors_df["Exposure (%)"]
+    ))
+    fig_factors.update_layout(title="Risk Factor Attribution")
     st.plotly_chart(fig_factors, use_container_width=True)
 
 
@@ -642,10 +786,6 @@ st.markdown("## Risk Trends")
 with st.expander("📈 Risk Trends - Click to expand / collapse", expanded=False):
     # === Rolling Volatility and Drawdowns ===
     st.subheader("📉 Rolling Risk Trends")
-    rolling_vol = portfolio_returns.rolling(30).std() * np.sqrt(252)
-    rolling_max = (1 + portfolio_returns).cumprod().cummax()
-    drawdowns = (1 + portfolio_returns).cumprod() / rolling_max - 1
-
     col4, col5 = st.columns(2)
     fig_vol = go.Figure()
     fig_vol.add_trace(go.Scatter(x=rolling_vol.index, y=rolling_vol, name="30D Volatility"))
@@ -654,9 +794,10 @@ with st.expander("📈 Risk Trends - Click to expand / collapse", expanded=False
 
     # === Ticker Drilldown ===
     st.subheader("🔎 Explore Stock Price")
-    selected = st.selectbox("Choose a ticker:", options=close_prices.columns)
+    selected = st.selectbox("Choose a ticker:", options=tickers_list)
+    i = tickers_list.index(selected)
     fig = go.Figure()
-    fig.add_trace(go.Scatter(x=close_prices.index, y=close_prices[selected], name=selected))
+    fig.add_trace(go.Scatter(x=dates, y=close_np[:, i], name=selected))
     fig.update_layout(title=f"{selected} Price History", xaxis_title="Date", yaxis_title="Price")
     st.plotly_chart(fig, use_container_width=True)
 
@@ -0,0 +1,65 @@
+import numpy as np
+from numba import njit
+
+
+# Rolling sample standard deviation (ddof=1), matching pandas' rolling(w).std().
+# The window mean and sum of squared deviations are updated in place as one
+# value enters and one leaves, so each step is O(1) and numerically stable.
+# Accumulators are float64; the output keeps the input dtype.
+@njit(cache=True)
+def rolling_std(x, w):
+    n = x.size
+    out = np.full(n, np.nan, dtype=x.dtype)
+    if w < 2 or n < w:
+        return out
+
+    mean = 0.0
+    m2 = 0.0
+    for i in range(w):
+        delta = x[i] - mean
+        mean += delta / (i + 1)
+        m2 += delta * (x[i] - mean)
+    out[w - 1] = np.sqrt(max(m2, 0.0) / (w - 1))
+
+    for i in range(w, n):
+        x_new = x[i]
+        x_old = x[i - w]
+        old_mean = mean
+        mean += (x_new - x_old) / w
+        m2 += (x_new - x_old) * (x_new - mean + x_old - old_mean)
+        out[i] = np.sqrt(max(m2, 0.0) / (w - 1))
+
+    return out
+
+
+# Drawdown from the running peak of the compounded return path. The cumulative
+# product, running max and divide are fused into one pass with no temporaries.
+# The peak starts at the first compounded value, as with cumprod().cummax().
+@njit(cache=True, fastmath=True)
+def drawdowns_kernel(r):
+    n = r.size
+    out = np.empty(n, dtype=r.dtype)
+    if n == 0:
+        return out
+    c = 1.0 + r[0]
+    m = c
+    out[0] = 0.0
+    for i in range(1, n):
+        c *= 1.0 + r[i]
+        m = c if c > m else m
+        out[i] = c / m - 1.0
+    return out
+
+
+# Single quantile (q in [0, 1]) by O(N) selection instead of a full sort.
+# Interpolates linearly between order statistics, like np.percentile's default.
+def quantile_fast(a, q):
+    a = np.asarray(a)
+    if a.size == 0:
+        raise ValueError("quantile of empty array")
+    pos = q * (a.size - 1)
+    k = int(np.floor(pos))
+    if k + 1 >= a.size:
+        return float(np.partition(a, k)[k])
+    p = np.partition(a, [k, k + 1])
+    return float(p[k] + (pos - k) * (p[k + 1] - p[k]))